@@ -1,6 +1,6 @@
 import argparse
+import logging
 import sys
-from screenshot import ScreenShot
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -25,6 +25,19 @@ Examples:
   # Capture screenshots at intervals (every 2 seconds for 10 seconds, short form)
   python screenshot_cli.py -i 2 -l 10
 
+  # Interval capture saved as PNG instead of the default JPEG
+  python screenshot_cli.py -i 2 -l 10 -f png
+
+  # Interval capture that skips re-encoding frames when the screen hasn't changed
+  python screenshot_cli.py -i 1 -l 600 --dedup
+
+  # Record 10 frames per second for a minute into output/screenshot.mp4 (requires ffmpeg)
+  python screenshot_cli.py -i 0.1 -l 60 --video
+
+  # Store raw frames in a single file, then convert them to PNGs afterwards
+  python screenshot_cli.py -i 0.05 -l 30 --raw-memmap output/session.raw
+  python tools/rawsession_to_pngs.py output/session.raw output/frames
+
   # Add timestamp to filename to avoid overwriting (short form)
   python screenshot_cli.py -t
 
@@ -33,6 +46,9 @@ Examples:
 
   # Region capture with timestamp and custom delay (short form)
   python screenshot_cli.py --x1 0 --y1 0 --x2 1920 --y2 1080 -d 1 -t
+
+  # Capture two regions from the same grab (saved as screenshot_0001.png, screenshot_0002.png)
+  python screenshot_cli.py -r 0 0 800 600 -r 800 0 1600 600
         """
     )
 
@@ -56,6 +72,12 @@ Examples:
         help="Append timestamp to the output filename to avoid overwriting."
     )
 
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Print progress messages, including one line per interval screenshot."
+    )
+
     # Region capture arguments
     parser.add_argument(
         "--x1",
@@ -81,6 +103,15 @@ Examples:
         help="Bottom-right Y coordinate (for region capture)."
     )
 
+    parser.add_argument(
+        "-r", "--region",
+        type=int,
+        nargs=4,
+        action="append",
+        metavar=("X1", "Y1", "X2", "Y2"),
+        help="Region to capture; repeat to capture several regions from a single grab."
+    )
+
     # Interval capture arguments
     parser.add_argument(
         "-i", "--interval",
@@ -94,6 +125,31 @@ Examples:
         help="Total duration in seconds for interval capture."
     )
 
+    parser.add_argument(
+        "-f", "--format",
+        choices=("png", "jpg"),
+        help="Image format for interval capture (default: jpg). JPEG saves much faster than PNG."
+    )
+
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="During interval capture, link unchanged frames to the previous file instead of re-encoding them."
+    )
+
+    parser.add_argument(
+        "--video",
+        action="store_true",
+        help="During interval capture, save a single MP4 video via ffmpeg instead of one image per frame."
+    )
+
+    parser.add_argument(
+        "--raw-memmap",
+        metavar="PATH",
+        help="During interval capture, store raw frames in one memory-mapped file at PATH "
+             "(convert with tools/rawsession_to_pngs.py)."
+    )
+
     return parser
 
 
@@ -108,6 +164,23 @@ def validate_arguments(args: argparse.Namespace) -> None:
         if not (interval_provided and time_limit_provided):
             raise ValueError("Both --interval and --time-limit must be provided for interval capture.")
 
+    # Check that interval-only options aren't given for single captures
+    if not interval_provided:
+        interval_options = {
+            "--format": args.format is not None,
+            "--dedup": args.dedup,
+            "--video": args.video,
+            "--raw-memmap": args.raw_memmap is not None,
+        }
+        given = [option for option, provided in interval_options.items() if provided]
+        if given:
+            raise ValueError(f"{', '.join(given)} can only be used with interval capture (--interval/--time-limit).")
+
+    # Check that --format isn't given for outputs that don't write image files
+    if args.format is not None and (args.video or args.raw_memmap is not None):
+        stream_option = "--video" if args.video else "--raw-memmap"
+        raise ValueError(f"--format cannot be used with {stream_option}; it only applies to image files.")
+
     # Check region capture requirements
     if any(coord is not None for coord in coords_provided):
         if not all(coord is not None for coord in coords_provided):
@@ -122,7 +195,7 @@ def determine_capture_type(args: argparse.Namespace) -> str:
 
     if interval_provided or time_limit_provided:
         return "interval"
-    elif all(coord is not None for coord in coords_provided):
+    elif args.region or all(coord is not None for coord in coords_provided):
         return "region"
     else:
         return "fullscreen"
@@ -133,15 +206,27 @@ def main() -> int:
     parser = create_parser()
     args = parser.parse_args()
 
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(message)s"
+    )
+
     try:
         # Validate argument combinations
         validate_arguments(args)
 
+        # Imported here so --help and argument errors don't pay for loading PIL
+        from screenshot import ScreenShot
+
         # Create ScreenShot object
         screenshot = ScreenShot(
             output=args.output,
             delay=args.delay,
-            timestamp=args.timestamp
+            timestamp=args.timestamp,
+            image_format=args.format or "jpg",
+            dedup=args.dedup,
+            video=args.video,
+            raw_path=args.raw_memmap
         )
 
         # Determine and execute the appropriate capture type
@@ -150,7 +235,10 @@ def main() -> int:
         if capture_type == "interval":
             success = screenshot.capture_interval(args.interval, args.time_limit)
         elif capture_type == "region":
-            success = screenshot.capture_area(args.x1, args.y1, args.x2, args.y2)
+            bboxes = [tuple(region) for region in args.region or []]
+            if args.x1 is not None:
+                bboxes.insert(0, (args.x1, args.y1, args.x2, args.y2))
+            success = screenshot.capture_areas(bboxes)
         else:  # fullscreen
             success = screenshot.capture_screen()
 
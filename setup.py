@@ -19,7 +19,6 @@ setup(
         "Topic :: Multimedia :: Graphics :: Graphics Editors",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
@@ -27,8 +26,11 @@ setup(
         "Operating System :: Microsoft :: Windows",
         "Operating System :: MacOS",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.8",
     install_requires=[
         "Pillow>=10.0.0",
     ],
+    extras_require={
+        "fast": ["mss>=9.0.0"],
+    },
 )
@@ -0,0 +1,92 @@
+import argparse
+import json
+import mmap
+import sys
+from pathlib import Path
+
+from PIL import Image
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create and configure the argument parser."""
+    parser = argparse.ArgumentParser(
+        description="Convert a raw interval-capture session (--raw-memmap) into PNG files.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Convert output/session.raw (with output/session.raw.json) into output/frames/frame_0001.png, ...
+  python tools/rawsession_to_pngs.py output/session.raw output/frames
+        """
+    )
+
+    parser.add_argument(
+        "raw_path",
+        help="Raw session file written by --raw-memmap; its metadata is read from <raw_path>.json."
+    )
+
+    parser.add_argument(
+        "output_dir",
+        help="Folder to write the PNG files to (created if missing)."
+    )
+
+    parser.add_argument(
+        "--compress-level",
+        type=int,
+        default=1,
+        choices=range(10),
+        metavar="{0-9}",
+        help="PNG compression level (default: 1)."
+    )
+
+    return parser
+
+
+def convert(raw_path: str, output_dir: str, compress_level: int = 1) -> int:
+    """
+    Write every frame of a raw session as a numbered PNG.
+
+    :param raw_path: Raw session file.
+    :param output_dir: Folder to write frame_0001.png, frame_0002.png, ... to.
+    :param compress_level: PNG compression level (0-9).
+    :return: Number of frames written.
+    """
+    with open(f"{raw_path}.json", "r", encoding="utf-8") as f:
+        metadata = json.load(f)
+
+    size = (metadata["width"], metadata["height"])
+    mode = metadata["mode"]
+    rawmode = metadata.get("rawmode", mode)
+    frame_count = metadata["frame_count"]
+    if frame_count == 0:
+        return 0
+
+    output_folder = Path(output_dir)
+    output_folder.mkdir(parents=True, exist_ok=True)
+
+    with open(raw_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as frames:
+        frame_bytes = len(frames) // frame_count
+        for index in range(frame_count):
+            offset = index * frame_bytes
+            image = Image.frombuffer(mode, size, frames[offset:offset + frame_bytes], "raw", rawmode, 0, 1)
+            image.save(output_folder / f"frame_{index + 1:04d}.png", compress_level=compress_level)
+
+    return frame_count
+
+
+def main() -> int:
+    """Main entry point for the converter."""
+    parser = create_parser()
+    args = parser.parse_args()
+
+    try:
+        count = convert(args.raw_path, args.output_dir, args.compress_level)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Wrote {count} frames to {args.output_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())